@@ -73,6 +73,7 @@ async def main():
     intents = discord.Intents.default()
     intents.members = True
     intents.message_content = True
+    intents.typing = False
     bot = commands.Bot(command_prefix=commands.when_mentioned_or('t;'), intents=intents)
 
     cogs = [file.stem for file in Path('remind', 'cogs').glob('*.py')]
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import subprocess
 import sys
@@ -56,6 +57,12 @@ class Meta(commands.Cog):
         """Command the bot or get information about the bot."""
         await ctx.send_help(ctx.command)
 
+    async def _flush_guild_settings(self):
+        # os._exit skips cog_unload, so write out any settings still waiting on the periodic flush.
+        reminders = self.bot.get_cog('Reminders')
+        if reminders is not None:
+            await reminders._serialize_guild_map()
+
     @meta.command(brief='Restarts Remind')
     @commands.check(check_if_superuser)
     async def restart(self, ctx):
@@ -63,6 +70,7 @@ class Meta(commands.Cog):
         # Really, we just exit with a special code
         # the magic is handled elsewhere
         await ctx.send('Restarting...')
+        await self._flush_guild_settings()
         os._exit(RESTART)
 
     @meta.command(brief='Kill Remind')
@@ -70,6 +78,7 @@ class Meta(commands.Cog):
     async def kill(self, ctx):
         """Restarts the bot."""
         await ctx.send('Dying...')
+        await self._flush_guild_settings()
         os._exit(0)
 
     @meta.command(brief='Is Remind up?')
@@ -108,11 +117,11 @@ class Meta(commands.Cog):
     async def resetcache(self, ctx):
         """Resets contest cache."""
         try:
-            clist_api.cache(True)
+            await asyncio.get_running_loop().run_in_executor(None, clist_api.cache, True)
             await ctx.send('```Cache reset completed. '
                            'Restart to reschedule all contest reminders.'
                            '```')
-        except BaseException:
+        except Exception:
             await ctx.send('```' + 'Cache reset failed.' + '```')
 
     # @meta.command(brief='Show Superuser')
@@ -1,19 +1,21 @@
 import asyncio
+import os
+import functools
+import gzip
+import heapq
 import random
-import json
 import pickle
 import logging
 import time
 import datetime as dt
 from pathlib import Path
 import re
-import copy
 
 from collections import defaultdict
-from recordtype import recordtype
 from datetime import datetime
 
 import discord
+import orjson
 from discord.ext import commands
 
 from remind.util.rounds import Round
@@ -25,6 +27,9 @@ from remind.util.website_schema import WebsitePatterns
 from remind.util import website_schema
 
 
+logger = logging.getLogger(__name__)
+
+
 class RemindersCogError(commands.CommandError):
     pass
 
@@ -34,23 +39,80 @@ _CONTEST_PAGINATE_WAIT_TIME = 5 * 60
 _FINISHED_CONTESTS_LIMIT = 5
 _CONTEST_REFRESH_PERIOD = 10 * 60  # seconds
 _GUILD_SETTINGS_BACKUP_PERIOD = 6 * 60 * 60  # seconds
-
-GuildSettings = recordtype(
-    'GuildSettings', [
-        ('remind_channel_id', None), ('remind_role_id', None), ('remind_before', None),
-        ('finalcall_channel_id', None), ('finalcall_before', None),
-        ('auto_nope_react', False),
-        ('add_first_reaction', False),
-        ('website_patterns', defaultdict(WebsitePatterns))])
+_GUILD_SETTINGS_FLUSH_PERIOD = 5  # seconds
+_FORMAT_CACHE_SIZE = 1024
+_EM = '\N{EN SPACE}'
+_TIME_LABELS = ('day', 'hr', 'min', 'sec')
+_LINK_RE = re.compile(r']\((http.+)\)')
+_START_TIME_RE = re.compile(r'<t:(\d+):[A-Za-z]>')
+_WEBSITE_PREFIXES = {website: data.prefix for website, data in website_schema.schema.items()}
+_SHORTHAND_TO_WEBSITE = {shorthand: website
+                         for website, data in website_schema.schema.items()
+                         for shorthand in data.shorthands}
+
+
+class GuildSettings:
+    __slots__ = _fields = (
+        'remind_channel_id', 'remind_role_id', 'remind_before',
+        'finalcall_channel_id', 'finalcall_before',
+        'auto_nope_react',
+        'add_first_reaction',
+        'website_patterns')
+
+    def __init__(self, remind_channel_id=None, remind_role_id=None, remind_before=None,
+                 finalcall_channel_id=None, finalcall_before=None,
+                 auto_nope_react=False,
+                 add_first_reaction=False,
+                 website_patterns=None):
+        self.remind_channel_id = remind_channel_id
+        self.remind_role_id = remind_role_id
+        self.remind_before = remind_before
+        self.finalcall_channel_id = finalcall_channel_id
+        self.finalcall_before = finalcall_before
+        self.auto_nope_react = auto_nope_react
+        self.add_first_reaction = add_first_reaction
+        self.website_patterns = defaultdict(WebsitePatterns) if website_patterns is None else website_patterns
+
+    def _asdict(self):
+        return {field: getattr(self, field) for field in self._fields}
+
+    def to_json(self):
+        data = self._asdict()
+        data['website_patterns'] = {website: {'allowed_patterns': patterns.allowed_patterns,
+                                              'disallowed_patterns': patterns.disallowed_patterns}
+                                    for website, patterns in self.website_patterns.items()}
+        return data
+
+    @classmethod
+    def from_json(cls, data):
+        # Only the subscription patterns are stored, the rest of each website's schema comes from the current one.
+        website_patterns = get_default_website_patterns()
+        for website, patterns in data.get('website_patterns', {}).items():
+            website_patterns[website].allowed_patterns = patterns['allowed_patterns']
+            website_patterns[website].disallowed_patterns = patterns['disallowed_patterns']
+        fields = {key: value for key, value in data.items() if key in cls._fields}
+        fields['website_patterns'] = website_patterns
+        return cls(**fields)
+
+    # Only used to unpickle legacy guild maps, which stored the field values as a tuple
+    # in the layout the former recordtype used.
+    def __setstate__(self, state):
+        for field, value in zip(self._fields, state):
+            setattr(self, field, value)
 
 
 class RemindRequest:
-    def __init__(self, channel, role, contest: Round, before_secs, send_time):
+    def __init__(self, channel, role, contest: Round, fields, before_secs, send_time):
         self.channel = channel
         self.role = role
         self.contest = contest
+        # (website, display name, value) embed fields, shared by all of a contest's requests
+        self.fields = fields
         self.before_secs = before_secs
+        self.before_str = _before_format(before_secs)
         self.send_time = send_time
+        # send_time on the monotonic clock asyncio.sleep schedules against
+        self.loop_send_time = asyncio.get_running_loop().time() + send_time - time.time()
 
 
 class FinalCallRequest:
@@ -60,91 +122,159 @@ class FinalCallRequest:
         self.embed_desc = embed.description
         self.embed_fields = [(field.name, field.value) for field in embed.fields]
 
+    def to_json(self):
+        return {'role_id': self.role_id, 'msg_id': self.msg_id,
+                'embed_desc': self.embed_desc, 'embed_fields': self.embed_fields}
+
+    @classmethod
+    def from_json(cls, data):
+        request = cls.__new__(cls)
+        request.role_id = data['role_id']
+        request.msg_id = data['msg_id']
+        request.embed_desc = data['embed_desc']
+        request.embed_fields = [tuple(field) for field in data['embed_fields']]
+        return request
+
+
+def get_default_website_patterns():
+    # Only the pattern lists are mutable, so a per-website copy is enough and much cheaper than a deepcopy.
+    return defaultdict(WebsitePatterns, {website: data.copy() for website, data in website_schema.schema.items()})
+
 
 def get_default_guild_settings():
     settings = GuildSettings()
-    settings.website_patterns = copy.deepcopy(website_schema.schema)
+    settings.website_patterns = get_default_website_patterns()
     return settings
 
 
-def _contest_start_time_format(contest):
-    seconds = int(contest.start_time.replace(tzinfo=dt.timezone.utc).timestamp())
-    return f'<t:{seconds}:F>'
-
-
-def _contest_duration_format(contest):
-    duration_days, duration_hrs, duration_mins, _ = discord_common.time_format(contest.duration.total_seconds())
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _duration_format(duration):
+    duration_days, duration_hrs, duration_mins, _ = discord_common.time_format(duration.total_seconds())
     duration = f'{duration_hrs}h {duration_mins}m'
     if duration_days > 0:
         duration = f'{duration_days}d ' + duration
     return duration
 
 
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _before_format(before_secs):
+    def make(value, label):
+        tmp = f'{value} {label}'
+        return tmp if value == 1 else tmp + 's'
+
+    values = discord_common.time_format(before_secs)
+    return ' '.join(make(value, label) for label, value in zip(_TIME_LABELS, values) if value > 0)
+
+
+# Every reaction to a reminder parses the same description, key on it so each is parsed once.
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _parse_contest_desc(desc):
+    link = _LINK_RE.search(desc).group(1)
+    start_time = int(_START_TIME_RE.search(desc).group(1))
+    return link, start_time
+
+
+def _website_patterns_key(website_patterns):
+    return tuple(sorted((website, tuple(data.allowed_patterns), tuple(data.disallowed_patterns))
+                        for website, data in website_patterns.items()))
+
+
+_DEFAULT_WEBSITE_PATTERNS_KEY = _website_patterns_key(website_schema.schema)
+
+
+def _schedule_fingerprint(settings):
+    if settings is None:
+        return None
+    return (settings.remind_channel_id, settings.remind_role_id, tuple(settings.remind_before or ()),
+            settings.finalcall_channel_id, settings.finalcall_before,
+            _website_patterns_key(settings.website_patterns))
+
+
+def _contest_start_time_format(contest):
+    return f'<t:{int(contest.start_timestamp)}:F>'
+
+
+def _contest_duration_format(contest):
+    return _duration_format(contest.duration)
+
+
+def _write_file_atomically(path, data):
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 def _get_formatted_contest_desc(start, duration, url):
-    em = '\N{EN SPACE}'
-    return f'{start}\nDuration:{em}{duration}{em}|{em}[link]({url})'
+    return f'{start}\nDuration:{_EM}{duration}{_EM}|{_EM}[link]({url})'
 
 
 def _get_contest_website_prefix(contest):
-    website_details = website_schema.schema[contest.website]
-    return website_details.prefix
+    return _WEBSITE_PREFIXES.get(contest.website, '')
+
+
+def _mention_or_not_set(obj):
+    return obj.mention if obj is not None else "Not Set"
 
 
 def _get_display_name(website, name):
     return (website + " || " + name) if website.lower() not in name.lower() else name
 
 
+# Rounds are only rebuilt when the contest db changes, so each one is rendered once for all guilds and pages.
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _get_embed_field(contest):
+    website = _get_contest_website_prefix(contest)
+    return (website, _get_display_name(website, contest.name),
+            _get_formatted_contest_desc(_contest_start_time_format(contest), _contest_duration_format(contest),
+                                        contest.url))
+
+
 def _get_embed_fields_from_contests(contests):
-    fields = []
-    for contest in contests:
-        start = _contest_start_time_format(contest)
-        duration = _contest_duration_format(contest)
-        value = _get_formatted_contest_desc(start, duration, contest.url)
-        website = _get_contest_website_prefix(contest)
-        fields.append((website, contest.name, value))
-    return fields
+    return [_get_embed_field(contest) for contest in contests]
 
 
 async def _send_reminder_at(request):
-    delay = request.send_time - dt.datetime.utcnow().timestamp()
+    delay = request.loop_send_time - asyncio.get_running_loop().time()
     if delay <= 0:
         return
 
     await asyncio.sleep(delay)
-    values = discord_common.time_format(request.before_secs)
-
-    def make(value, label):
-        tmp = f'{value} {label}'
-        return tmp if value == 1 else tmp + 's'
-
-    labels = 'day hr min sec'.split()
-    before_str = ' '.join(make(value, label) for label, value in zip(labels, values) if value > 0)
-    desc = f'About to start in {before_str}!'
+    desc = f'About to start in {request.before_str}!'
     embed = discord_common.color_embed(description=desc)
     if request.contest.is_rare():
         embed.set_footer(text=f"Its once in a while contest, you wouldn't wanna miss 👀")
-    for website, name, value in _get_embed_fields_from_contests([request.contest]):
-        embed.add_field(name=_get_display_name(website, name), value=value, inline=False)
+    for website, name, value in request.fields:
+        embed.add_field(name=name, value=value, inline=False)
     await request.channel.send(request.role.mention + f' Its {website} time!', embed=embed)
 
 
-def filter_contests(filters, contests):
+async def _send_reminders(requests):
+    # A single task per guild sleeps through its reminders in send_time order.
+    for request in requests:
+        try:
+            await _send_reminder_at(request)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f'Failed to send reminder for {request.contest!r}: {e!r}')
+
+
+def _filter_websites(filters):
+    # None means no filtering, as opposed to filters that match no known website.
     if not filters:
-        return contests
+        return None
+    return frozenset(_SHORTHAND_TO_WEBSITE[contest_filter[1:]] for contest_filter in filters
+                     if contest_filter.startswith("+") and contest_filter[1:] in _SHORTHAND_TO_WEBSITE)
+
 
-    filtered_contests = []
-    for contest in contests:
-        eligible = False
-        for contest_filter in filters:
-            if contest_filter[0] == "+":
-                filter = contest_filter[1:]
-                for website, data in website_schema.schema.items():
-                    eligible |= (website == contest.website and filter in data.shorthands)
-        if eligible:
-            filtered_contests.append(contest)
-    return filtered_contests
+def filter_contests(filters, contests):
+    websites = _filter_websites(filters)
+    if websites is None:
+        return contests
+    return [contest for contest in contests if contest.website in websites]
 
 
+# Only referenced by legacy pickled guild maps, which stored finalcall_map as defaultdicts built from it.
 def create_tuple_defaultdict():
     return defaultdict(FinalCallRequest)
 
@@ -154,18 +284,37 @@ class Reminders(commands.Cog):
         self.bot = bot
         self.future_contests = None
         self.contest_cache = None
+        self.contest_db_mtime = None
+        # Maps the raw fields a `Round` is built from to that `Round`, reused across db rewrites
+        self.round_index = dict()
         self.active_contests = None
         self.finished_contests = None
-        self.start_time_map = defaultdict(list)
-        self.task_map = defaultdict(list)
+        # Maps (id of a contest list, website patterns key) to the contests desired under those patterns
+        self.guild_contests_cache = dict()
+        # Maps (id of a cached guild contest list, filtered websites, title) to its rendered contest list pages
+        self.contest_pages_cache = dict()
+        # Maps reminder message id to its embed, reminder embeds are never edited
+        self.reminder_embed_cache = dict()
+        # Maps guild_id to the task sending that guild's reminders
+        self.task_map = dict()
         # Maps guild_id to `GuildSettings`
         self.guild_map = defaultdict(get_default_guild_settings)
+        # Maps guild_id to the settings fingerprint its tasks were last scheduled with
+        self.schedule_fingerprints = dict()
         self.last_guild_backup_time = -1
+        self.guild_map_dirty = False
+        self.update_task = None
+        self.flush_task = None
+        self.serialize_lock = asyncio.Lock()
         self.reaction_emoji = "✅"
         self.nope_emoji = 973583086174498847
 
-        self.finalcall_map = defaultdict(create_tuple_defaultdict)
-        self.finaltasks = defaultdict(lambda: dict())
+        # Maps guild_id to a dict of contest link to its `FinalCallRequest`
+        self.finalcall_map = dict()
+        # Maps guild_id to a dict of contest link to its final call task
+        self.finaltasks = dict()
+        # Maps message_id to the pending task adding the nope reaction to that reminder if unanswered
+        self.nope_tasks = dict()
 
         self.member_converter = commands.MemberConverter()
         self.role_converter = commands.RoleConverter()
@@ -176,127 +325,211 @@ class Reminders(commands.Cog):
     @discord_common.once
     async def on_ready(self):
         guild_map_path = Path(constants.GUILD_SETTINGS_MAP_PATH)
+        loaded = False
+        if guild_map_path.exists():
+            try:
+                self._load_guild_map(guild_map_path)
+                loaded = True
+            except (OSError, orjson.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError):
+                self.logger.exception('Could not load guild settings map, falling back to the legacy map')
+                self.guild_map.clear()
+                self.finalcall_map.clear()
+        if not loaded:
+            try:
+                self._load_legacy_guild_map()
+            except (KeyError, ValueError, TypeError, AttributeError):
+                self.logger.exception('Could not load legacy guild settings map, starting empty')
+                self.guild_map.clear()
+                self.finalcall_map = dict()
+                self.guild_map_dirty = False
+        self.update_task = asyncio.create_task(self._update_task())
+        self.flush_task = asyncio.create_task(self._flush_task())
+
+    async def cog_unload(self):
+        for task in (self.update_task, self.flush_task, *self.task_map.values()):
+            if task is not None:
+                task.cancel()
+        for tasks in self.finaltasks.values():
+            for task in tasks.values():
+                task.cancel()
+        for task in self.nope_tasks.values():
+            task.cancel()
+        await self._serialize_guild_map()
+
+    def _load_guild_map(self, guild_map_path):
+        data = orjson.loads(guild_map_path.read_bytes())
+        for guild_id, guild_settings in data["guild_map"].items():
+            self.guild_map[int(guild_id)] = GuildSettings.from_json(guild_settings)
+        for guild_id, requests in data["finalcall_map"].items():
+            self.finalcall_map[int(guild_id)] = {link: FinalCallRequest.from_json(request)
+                                                 for link, request in requests.items()}
+
+    def _load_legacy_guild_map(self):
+        # Guild maps used to be pickled, read one if present and write it back out as json on the next flush.
+        guild_map_path = Path(constants.LEGACY_GUILD_SETTINGS_MAP_PATH)
         try:
-            with guild_map_path.open('rb') as guild_map_file:
-                data = pickle.load(guild_map_file)
-                guild_map = data["guild_map"]
-                self.finalcall_map = data["finalcall_map"]
-                for guild_id, guild_settings in guild_map.items():
-                    self.guild_map[guild_id] = GuildSettings(**{key: value
-                                                                for key, value
-                                                                in guild_settings._asdict().items()
-                                                                if key in GuildSettings._fields})
-        except BaseException:
-            pass
-        asyncio.create_task(self._update_task())
+            data = pickle.loads(guild_map_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            self.logger.exception('Could not load legacy guild settings map')
+            return
+        self.finalcall_map = {guild_id: dict(requests)
+                              for guild_id, requests in data["finalcall_map"].items()}
+        for guild_id, guild_settings in data["guild_map"].items():
+            self.guild_map[guild_id] = GuildSettings(**{key: value
+                                                        for key, value in guild_settings._asdict().items()
+                                                        if key in GuildSettings._fields})
+        self.guild_map_dirty = True
 
     async def cog_after_invoke(self, ctx):
-        self._serialize_guild_map()
-        self._backup_serialize_guild_map()
-        self._reschedule_reminder_tasks(ctx.guild.id)
-        self._reschedule_finalcall_tasks(ctx.guild.id)
+        guild_id = ctx.guild.id
+        # Most commands don't touch anything scheduling depends on, don't churn the tasks for those.
+        if self.schedule_fingerprints.get(guild_id) != _schedule_fingerprint(self.guild_map.get(guild_id)):
+            self._reschedule_guild_tasks(guild_id)
 
     async def _update_task(self):
-        self.logger.info(f'Invoking Scheduled Reminder Updates')
-        self._generate_contest_cache()
-        contest_cache = self.contest_cache
-        current_time = dt.datetime.utcnow()
-
-        self.future_contests = [
-            contest for contest in contest_cache
-            if contest.start_time > current_time
-        ]
-        self.finished_contests = [
-            contest for contest in contest_cache
-            if contest.start_time + contest.duration < current_time
-        ]
-        self.active_contests = [
-            contest for contest in contest_cache
-            if contest.start_time <= current_time <= contest.start_time + contest.duration
-        ]
-
-        self.active_contests.sort(key=lambda contest: contest.start_time)
-        self.finished_contests.sort(key=lambda contest: contest.start_time + contest.duration, reverse=True)
-        self.future_contests.sort(key=lambda contest: contest.start_time)
-        # Keep most recent _FINISHED_LIMIT
-        self.finished_contests = self.finished_contests[:_FINISHED_CONTESTS_LIMIT]
-        self.start_time_map.clear()
-        for contest in self.future_contests:
-            self.start_time_map[time.mktime(contest.start_time.timetuple())].append(contest)
-        self._reschedule_all_tasks()
-        await asyncio.sleep(_CONTEST_REFRESH_PERIOD)
-        asyncio.create_task(self._update_task())
+        while True:
+            try:
+                self.logger.info(f'Invoking Scheduled Reminder Updates')
+                # Fetching and parsing the contest db is blocking, keep it off the event loop.
+                await asyncio.get_running_loop().run_in_executor(None, self._generate_contest_cache)
+                current_time = dt.datetime.utcnow()
+                self.guild_contests_cache.clear()
+                self.contest_pages_cache.clear()
+                self.reminder_embed_cache.clear()
+
+                future_contests, active_contests, finished_contests = [], [], []
+                for contest in self.contest_cache:
+                    if contest.start_time > current_time:
+                        future_contests.append(contest)
+                    elif contest.end_time < current_time:
+                        finished_contests.append(contest)
+                    else:
+                        active_contests.append(contest)
+
+                self.future_contests = future_contests
+                self.active_contests = active_contests
+                # Keep most recent _FINISHED_LIMIT
+                self.finished_contests = heapq.nlargest(_FINISHED_CONTESTS_LIMIT, finished_contests,
+                                                        key=lambda contest: contest.end_time)
+                await self._reschedule_all_tasks()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception('Scheduled reminder update failed')
+            await asyncio.sleep(_CONTEST_REFRESH_PERIOD)
+
+    async def _flush_task(self):
+        # Coalesce all guild map changes made since the last tick into a single write.
+        while True:
+            await asyncio.sleep(_GUILD_SETTINGS_FLUSH_PERIOD)
+            try:
+                await self._serialize_guild_map()
+                await self._backup_serialize_guild_map()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception('Guild settings flush failed')
 
     def _generate_contest_cache(self):
         clist.cache(forced=False)
         db_file = Path(constants.CONTESTS_DB_FILE_PATH)
-        with db_file.open() as f:
-            data = json.load(f)
-        contests = [Round(contest) for contest in data['objects']]
-        self.contest_cache = [contest for contest in contests if contest.is_desired(website_schema.schema)]
+        db_mtime = db_file.stat().st_mtime_ns
+        if self.contest_cache is not None and db_mtime == self.contest_db_mtime:
+            # The db has not been rewritten since the last parse.
+            return
 
-    def get_guild_contests(self, contests, guild_id):
-        settings = self.guild_map[guild_id]
+        self.contest_db_mtime = db_mtime
+        data = orjson.loads(db_file.read_bytes())
+        # Most contests are unchanged between rewrites, only build Rounds for new or edited ones.
+        round_index = dict()
+        for contest in data['objects']:
+            key = (contest['id'], contest['start'], contest['duration'], contest['href'], contest['resource'],
+                   contest['event'])
+            round_index[key] = self.round_index.get(key) or Round(contest)
+        self.round_index = round_index
+        contests = [contest for contest in round_index.values() if contest.is_desired(website_schema.schema)]
+        # An url can uniquely identify a contest, keep one desired entry per url and start time for all guilds.
+        self.contest_cache = list({(contest.url, contest.start_time): contest for contest in contests}.values())
+        # Sorted once per parse, so partitioning it on every refresh keeps each bucket in start time order.
+        self.contest_cache.sort(key=lambda contest: contest.start_time)
 
-        desired_contests = []
-        for contest in contests:
-            if contest.is_desired(settings.website_patterns):
-                desired_contests.append(contest)
+    def get_guild_contests(self, contests, guild_id):
+        settings = self.guild_map.get(guild_id)
+        if settings is None:
+            return contests
+        patterns_key = _website_patterns_key(settings.website_patterns)
+        if patterns_key == _DEFAULT_WEBSITE_PATTERNS_KEY:
+            # The contest cache is already filtered by the default patterns.
+            return contests
+        # Guilds with the same subscriptions share the filtered list until the next contest refresh.
+        key = (id(contests), patterns_key)
+        desired_contests = self.guild_contests_cache.get(key)
+        if desired_contests is None:
+            website_patterns = settings.website_patterns
+            desired_contests = [contest for contest in contests if contest.is_desired(website_patterns)]
+            self.guild_contests_cache[key] = desired_contests
 
         return desired_contests
 
-    def _reschedule_all_tasks(self):
+    async def _reschedule_all_tasks(self):
         for guild in self.bot.guilds:
-            self._reschedule_reminder_tasks(guild.id)
-            self._reschedule_finalcall_tasks(guild.id)
+            try:
+                self._reschedule_guild_tasks(guild.id)
+            except Exception as e:
+                self.logger.error(f'Failed to reschedule tasks for guild "{guild}": {e!r}')
+            # Let other coroutines run between guilds instead of holding the loop for the whole sweep.
+            await asyncio.sleep(0)
+
+    def _reschedule_guild_tasks(self, guild_id):
+        self.schedule_fingerprints[guild_id] = _schedule_fingerprint(self.guild_map.get(guild_id))
+        self._reschedule_reminder_tasks(guild_id)
+        self._reschedule_finalcall_tasks(guild_id)
 
     def _reschedule_reminder_tasks(self, guild_id):
-        for task in self.task_map[guild_id]:
+        task = self.task_map.pop(guild_id, None)
+        if task is not None:
             task.cancel()
-        self.task_map[guild_id].clear()
         self.logger.info(f'Tasks for guild "{self.bot.get_guild(guild_id)}" cleared')
 
-        if not self.start_time_map:
+        if not self.future_contests:
             return
 
-        settings = self.guild_map[guild_id]
-        if settings.remind_role_id is None:
+        settings = self.guild_map.get(guild_id)
+        if settings is None or settings.remind_role_id is None:
             return
 
         guild = self.bot.get_guild(guild_id)
         channel, role = guild.get_channel(settings.remind_channel_id), guild.get_role(settings.remind_role_id)
 
-        for start_time, contests in self.start_time_map.items():
-            contests = self.get_guild_contests(contests, guild_id)
-            if not contests:
-                continue
-
-            website_seggregated_contests = dict()
-            for contest in contests:
-                website_seggregated_contests[contest.url] = contest  # an url can uniquely identify a contest
+        requests = []
+        for contest in self.get_guild_contests(self.future_contests, guild_id):
+            fields = _get_embed_fields_from_contests([contest])
+            for before_mins in settings.remind_before:
+                before_secs = 60 * before_mins
+                requests.append(RemindRequest(channel, role, contest, fields, before_secs,
+                                              contest.start_timestamp - before_secs))
 
-            for _, seg_contest in website_seggregated_contests.items():
-                for before_mins in settings.remind_before:
-                    before_secs = 60 * before_mins
-                    request = RemindRequest(channel, role, seg_contest, before_secs, start_time - before_secs)
-                    task = asyncio.create_task(_send_reminder_at(request))
-                    self.task_map[guild_id].append(task)
+        if requests:
+            requests.sort(key=lambda request: request.send_time)
+            self.task_map[guild_id] = asyncio.create_task(_send_reminders(requests))
 
-        self.logger.info(
-            f'{len(self.task_map[guild_id])} reminder tasks scheduled for guild "{self.bot.get_guild(guild_id)}"')
+        self.logger.info(f'{len(requests)} reminders scheduled for guild "{self.bot.get_guild(guild_id)}"')
 
     def _reschedule_finalcall_tasks(self, guild_id):
-        if not self.finalcall_map[guild_id]:
+        if not self.finalcall_map.get(guild_id):
             return
 
-        pending_reschedule = []
-        for link, data in self.finalcall_map[guild_id].items():
-            try:
-                pending_reschedule.append(data)
-                task = self.finaltasks[guild_id][link]
-                task.cancel()
-            except KeyError:
-                pass
+        settings = self.guild_map.get(guild_id)
+        if settings is None or settings.finalcall_before is None:
+            # Leave pending final calls alone until the guild is configured again.
+            return
+
+        finalcall_before = settings.finalcall_before
+        pending_reschedule = list(self.finalcall_map[guild_id].values())
+        for task in self.finaltasks.pop(guild_id, {}).values():
+            task.cancel()
 
         self.finalcall_map[guild_id].clear()
 
@@ -307,15 +540,18 @@ class Reminders(commands.Cog):
             for (name, value) in embed_fields:
                 embed.add_field(name=name, value=value, inline=False)
             link, start_time = self.get_values_from_embed(embed)
-            send_time = start_time - self.guild_map[guild_id].finalcall_before * 60
+            send_time = start_time - finalcall_before * 60
             reaction_role = self.bot.get_guild(guild_id).get_role(data.role_id)
             if reaction_role is not None:
                 task = asyncio.create_task(
                     self.send_finalcall_reminder(embed, guild_id, reaction_role, send_time, link))
                 self.finalcall_map[guild_id][link] = FinalCallRequest(role_id=reaction_role.id, embed=embed,
                                                                       msg_id=data.msg_id)
-                self.finaltasks[guild_id][link] = task
+                self.finaltasks.setdefault(guild_id, dict())[link] = task
 
+        if len(self.finalcall_map[guild_id]) != len(pending_reschedule):
+            # Final calls whose role was deleted have been dropped.
+            self.guild_map_dirty = True
         self.logger.info(
             f'{len(self.finalcall_map[guild_id])} final calls scheduled for guild "{self.bot.get_guild(guild_id)}"')
 
@@ -326,37 +562,64 @@ class Reminders(commands.Cog):
         for chunk in chunks:
             embed = discord_common.color_embed()
             for website, name, value in _get_embed_fields_from_contests(chunk):
-                embed.add_field(name=_get_display_name(website, name), value=value, inline=False)
+                embed.add_field(name=name, value=value, inline=False)
             pages.append((title, embed))
         return pages
 
-    async def _send_contest_list(self, ctx, contests, *, title, empty_msg):
+    async def _send_contest_list(self, ctx, contests, filters, *, title, empty_msg):
         if contests is None:
             raise RemindersCogError('Contest list not present')
-        if len(contests) == 0:
+        contests = self.get_guild_contests(contests, ctx.guild.id)
+        # contests is cached until the next refresh, so its pages can be too.
+        # Keyed on the resolved websites so differently spelled or ordered filters share an entry.
+        key = (id(contests), _filter_websites(filters), title)
+        pages = self.contest_pages_cache.get(key)
+        if pages is None:
+            pages = self._make_contest_pages(filter_contests(filters, contests), title)
+            self.contest_pages_cache[key] = pages
+        if not pages:
             await ctx.send(embed=discord_common.embed_neutral(empty_msg))
             return
-        pages = self._make_contest_pages(contests, title)
         paginator.paginate(self.bot, ctx.channel, pages, wait_time=_CONTEST_PAGINATE_WAIT_TIME,
                            set_pagenum_footers=True)
 
-    def _serialize_guild_map(self):
+    def _dump_guild_map(self):
+        data = {
+            "guild_map": {str(guild_id): guild_settings.to_json()
+                          for guild_id, guild_settings in self.guild_map.items()},
+            "finalcall_map": {str(guild_id): {link: request.to_json() for link, request in requests.items()}
+                              for guild_id, requests in self.finalcall_map.items()}}
+        return orjson.dumps(data)
+
+    async def _write_guild_map(self, out_path, data):
+        # Encoding happens on the loop so the maps can't change underneath it, only the disk write is offloaded.
+        async with self.serialize_lock:
+            await asyncio.get_running_loop().run_in_executor(None, _write_file_atomically, out_path, data)
+
+    async def _serialize_guild_map(self):
+        if not self.guild_map_dirty:
+            return
+
+        # Cleared before the write so changes made while it is in flight mark the map dirty again.
+        self.guild_map_dirty = False
         self.logger.info("Serializing db to local file")
-        data = {"guild_map": self.guild_map, "finalcall_map": self.finalcall_map}
-        out_path = Path(constants.GUILD_SETTINGS_MAP_PATH)
-        with out_path.open(mode='wb') as out_file:
-            pickle.dump(data, out_file)
+        try:
+            await self._write_guild_map(Path(constants.GUILD_SETTINGS_MAP_PATH), self._dump_guild_map())
+        except BaseException:
+            self.guild_map_dirty = True
+            raise
 
-    def _backup_serialize_guild_map(self):
-        current_time_stamp = int(dt.datetime.utcnow().timestamp())
+    async def _backup_serialize_guild_map(self):
+        current_time_stamp = int(time.time())
         if current_time_stamp - self.last_guild_backup_time < _GUILD_SETTINGS_BACKUP_PERIOD:
             return
 
         self.last_guild_backup_time = current_time_stamp
-        out_path = Path(constants.GUILD_SETTINGS_MAP_PATH + "_" + str(current_time_stamp))
-        data = {"guild_map": self.guild_map, "finalcall_map": self.finalcall_map}
-        with out_path.open(mode='wb') as out_file:
-            pickle.dump(data, out_file)
+        guild_map_path = Path(constants.GUILD_SETTINGS_MAP_PATH)
+        out_path = guild_map_path.with_name(f'{guild_map_path.stem}_{current_time_stamp}{guild_map_path.suffix}.gz')
+        # Backups pile up and are only read by hand, so they are kept compressed.
+        data = await asyncio.get_running_loop().run_in_executor(None, gzip.compress, self._dump_guild_map())
+        await self._write_guild_map(out_path, data)
 
     @commands.group(brief='Commands for contest reminders', invoke_without_command=True)
     async def remind(self, ctx):
@@ -378,13 +641,15 @@ class Reminders(commands.Cog):
 
         before = list(before)
         before = sorted(before, reverse=True)
-        self.guild_map[ctx.guild.id].remind_channel_id = ctx.channel.id
-        self.guild_map[ctx.guild.id].remind_role_id = role.id
-        self.guild_map[ctx.guild.id].remind_before = before
+        settings = self.guild_map[ctx.guild.id]
+        settings.remind_channel_id = ctx.channel.id
+        settings.remind_role_id = role.id
+        settings.remind_before = before
+        self.guild_map_dirty = True
 
-        remind_channel = ctx.guild.get_channel(self.guild_map[ctx.guild.id].remind_channel_id)
-        remind_role = ctx.guild.get_role(self.guild_map[ctx.guild.id].remind_role_id)
-        remind_before_str = f"At {', '.join(str(mins) for mins in self.guild_map[ctx.guild.id].remind_before)} " \
+        remind_channel = ctx.guild.get_channel(settings.remind_channel_id)
+        remind_role = ctx.guild.get_role(settings.remind_role_id)
+        remind_before_str = f"At {', '.join(str(mins) for mins in settings.remind_before)} " \
                             f"mins before contest "
 
         embed = discord_common.embed_success('Reminder settings saved successfully')
@@ -399,7 +664,8 @@ class Reminders(commands.Cog):
     async def reset_subscriptions(self, ctx):
         """ Resets the judges settings to the default ones.
         """
-        self.guild_map[ctx.guild.id].website_patterns = copy.deepcopy(website_schema.schema)
+        self.guild_map[ctx.guild.id].website_patterns = get_default_website_patterns()
+        self.guild_map_dirty = True
         await ctx.send(embed=discord_common.embed_success('Succesfully reset the subscriptions to the default ones'))
 
     def _set_guild_setting(self, guild_id, websites, unsubscribe):
@@ -412,12 +678,13 @@ class Reminders(commands.Cog):
                 continue
 
             guild_settings.website_patterns[website].allowed_patterns = [] if unsubscribe else \
-                copy.deepcopy(website_schema.schema[website].allowed_patterns)
+                website_schema.schema[website].allowed_patterns[:]
             guild_settings.website_patterns[website].disallowed_patterns = [''] if unsubscribe else \
-                copy.deepcopy(website_schema.schema[website].disallowed_patterns)
+                website_schema.schema[website].disallowed_patterns[:]
             supported_websites.append(website)
 
         self.guild_map[guild_id] = guild_settings
+        self.guild_map_dirty = True
         return supported_websites, unsupported_websites
 
     @remind.command(brief='Start contest reminders from websites.')
@@ -465,7 +732,8 @@ class Reminders(commands.Cog):
     @remind.command(brief='Clear all reminder settings')
     @commands.has_any_role('Admin', constants.REMIND_MODERATOR_ROLE)
     async def clear(self, ctx):
-        del self.guild_map[ctx.guild.id]
+        self.guild_map.pop(ctx.guild.id, None)
+        self.guild_map_dirty = True
         await ctx.send(embed=discord_common.embed_success('Reminder settings cleared'))
 
     @commands.group(brief='Commands for listing contests', invoke_without_command=True)
@@ -484,66 +752,63 @@ class Reminders(commands.Cog):
     async def future(self, ctx, *filters):
         """List future contests.
         """
-        contests = filter_contests(filters, self.get_guild_contests(self.future_contests, ctx.guild.id))
-        await self._send_contest_list(ctx, contests, title='Future contests', empty_msg='No future contests scheduled')
+        await self._send_contest_list(ctx, self.future_contests, filters, title='Future contests',
+                                      empty_msg='No future contests scheduled')
 
     @clist.command(brief='List active contests')
     async def active(self, ctx, *filters):
         """List active contests."""
-        contests = filter_contests(filters, self.get_guild_contests(self.active_contests, ctx.guild.id))
-        await self._send_contest_list(ctx, contests, title='Active contests', empty_msg='No contests currently active')
+        await self._send_contest_list(ctx, self.active_contests, filters, title='Active contests',
+                                      empty_msg='No contests currently active')
 
     @clist.command(brief='List recent finished contests')
     async def finished(self, ctx, *filters):
         """List recently concluded contests."""
-        contests = filter_contests(filters, self.get_guild_contests(self.finished_contests, ctx.guild.id))
-        await self._send_contest_list(ctx, contests, title='Recently finished contests',
+        await self._send_contest_list(ctx, self.finished_contests, filters, title='Recently finished contests',
                                       empty_msg='No finished contests found')
 
     async def send_finalcall_reminder(self, embed, guild_id, role, send_time, link):
         send_msg = "GLHF!"
-        settings = self.guild_map[guild_id]
+        settings = self.guild_map.get(guild_id)
+        if settings is None or settings.finalcall_before is None:
+            return
+
+        # send_time on the monotonic clock asyncio.sleep schedules against
+        loop = asyncio.get_running_loop()
+        loop_send_time = loop.time() + send_time - time.time()
 
+        msg = None
         # sleep till the ping time
-        delay = send_time - dt.datetime.now().timestamp()
+        delay = loop_send_time - loop.time()
         if delay >= 0:
             await asyncio.sleep(delay)
-
-            def make(value, label):
-                tmp = f'{value} {label}'
-                return tmp if value == 1 else tmp + 's'
-
-            labels = 'day hr min sec'.split()
-            values = discord_common.time_format(settings.finalcall_before * 60)
-            before_str = ' '.join(make(value, label) for label, value in zip(labels, values) if value > 0)
-            desc = f'About to start in {before_str}!'
+            desc = f'About to start in {_before_format(settings.finalcall_before * 60)}!'
             embed.description = desc
             channel = self.bot.get_channel(settings.finalcall_channel_id)
             msg = await channel.send(role.mention + " " + send_msg, embed=embed)
             self.finalcall_map[guild_id][link].msg_id = msg.id
-            self._serialize_guild_map()
+            self.guild_map_dirty = True
 
         # sleep till contest starts
-        time_to_contest = max(0, send_time + settings.finalcall_before * 60 - dt.datetime.utcnow().timestamp())
+        time_to_contest = max(0, loop_send_time + settings.finalcall_before * 60 - loop.time())
         await asyncio.sleep(time_to_contest)
 
         # delete role and task
-        if link in self.finalcall_map[guild_id]:
-            msg_id = self.finalcall_map[guild_id][link].msg_id
-            message = await self.bot.get_channel(settings.finalcall_channel_id).fetch_message(msg_id)
-            await message.edit(content=send_msg)
+        if link in self.finalcall_map.get(guild_id, {}):
+            if msg is None:
+                # The ping was sent before a restart or reschedule.
+                msg_id = self.finalcall_map[guild_id][link].msg_id
+                msg = await self.bot.get_channel(settings.finalcall_channel_id).fetch_message(msg_id)
+            await msg.edit(content=send_msg)
             del self.finalcall_map[guild_id][link]
             del self.finaltasks[guild_id][link]
         if role is not None:
             await role.delete()
-        self._serialize_guild_map()
+        self.guild_map_dirty = True
 
     @staticmethod
     def get_values_from_embed(embed):
-        desc = embed.fields[0].value
-        link = re.findall(r']\((http.+)\)', desc)[0]
-        start_time = int(re.findall(r'<t:(\d+):[A-za-z]>', desc)[0])
-        return link, start_time
+        return _parse_contest_desc(embed.fields[0].value)
 
     async def create_finalcall_role(self, guild_id, embed):
         contest_name = embed.fields[0].name
@@ -552,98 +817,126 @@ class Reminders(commands.Cog):
         return role
 
     async def get_finalcall_taskrole(self, guild_id, embed, remove=False):
+        settings = self.guild_map.get(guild_id)
+        if settings is None or settings.finalcall_before is None:
+            return None
+
         guild = self.bot.get_guild(guild_id)
         link, start_time = self.get_values_from_embed(embed)
-        send_time = start_time - self.guild_map[guild_id].finalcall_before * 60
+        send_time = start_time - settings.finalcall_before * 60
 
-        if link in self.finalcall_map[guild_id]:
-            reaction_role = guild.get_role(self.finalcall_map[guild_id][link].role_id)
-        elif (not remove) and send_time > dt.datetime.utcnow().timestamp():
+        request = self.finalcall_map.get(guild_id, {}).get(link)
+        if request is not None:
+            reaction_role = guild.get_role(request.role_id)
+        elif (not remove) and send_time > time.time():
             reaction_role = await self.create_finalcall_role(guild_id, embed)
             task = asyncio.create_task(self.send_finalcall_reminder(embed, guild_id, reaction_role, send_time, link))
-            self.finalcall_map[guild_id][link] = FinalCallRequest(embed=embed, role_id=reaction_role.id)
-            self.finaltasks[guild_id][link] = task
+            self.finalcall_map.setdefault(guild_id, dict())[link] = FinalCallRequest(embed=embed,
+                                                                                    role_id=reaction_role.id)
+            self.finaltasks.setdefault(guild_id, dict())[link] = task
+            self.guild_map_dirty = True
         else:
             reaction_role = None
 
         return reaction_role
 
-    async def do_validation_check(self, payload):
-        settings = self.guild_map[payload.guild_id]
-        member = self.bot.get_guild(payload.guild_id).get_member(payload.user_id)
-        if member.bot or settings.remind_channel_id is None or settings.remind_channel_id != payload.channel_id \
-            or payload.emoji.name != self.reaction_emoji or settings.finalcall_channel_id is None:
+    async def do_validation_check(self, payload, *, count_reactions=False):
+        settings = self.guild_map.get(payload.guild_id)
+        # Settle everything that doesn't need the network before fetching the message.
+        if settings is None or settings.remind_channel_id is None or settings.remind_channel_id != payload.channel_id \
+            or payload.emoji.name != self.reaction_emoji or settings.finalcall_channel_id is None \
+                or settings.finalcall_before is None or payload.user_id == self.bot.user.id:
+            return None
+        # payload.member is only filled in for reaction adds.
+        member = payload.member or self.bot.get_guild(payload.guild_id).get_member(payload.user_id)
+        if member is None or member.bot:
             return None
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-        reaction_count = sum(reaction.count for reaction in message.reactions if str(reaction) == self.reaction_emoji)
+        embed = self.reminder_embed_cache.get(payload.message_id)
+        if embed is not None and not count_reactions:
+            return None, embed, member
 
+        message = await self._get_message(payload.channel_id, payload.message_id)
         if not message.embeds:
             return None
 
-        return reaction_count, message.embeds[0]
+        embed = self.reminder_embed_cache[payload.message_id] = message.embeds[0]
+        # A message has at most one reaction entry per emoji.
+        reaction_count = next((reaction.count for reaction in message.reactions
+                               if reaction.emoji == self.reaction_emoji), 0)
+        return reaction_count, embed, member
+
+    async def _get_message(self, channel_id, message_id):
+        # Reactions on cached messages are kept current by the gateway, only fetch once it has been evicted.
+        message = discord.utils.get(reversed(self.bot.cached_messages), id=message_id)
+        if message is None:
+            message = await self.bot.get_channel(channel_id).fetch_message(message_id)
+        return message
 
     async def victim_card(self, member):
         self.logger.error(f'Failed to send DM to {member}')
 
+    async def send_dm(self, member, content):
+        try:
+            member_dm = await member.create_dm()
+            await member_dm.send(content)
+        except discord.HTTPException:
+            await self.victim_card(member)
+
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
         response = await self.do_validation_check(payload)
         if response is None:
             return
 
-        _, embed = response
+        _, embed, member = response
+        settings = self.guild_map.get(payload.guild_id)
+        if settings is None:
+            return
         _, start_time = self.get_values_from_embed(embed)
-        send_time = start_time - self.guild_map[payload.guild_id].finalcall_before * 60
+        send_time = start_time - settings.finalcall_before * 60
 
-        if send_time < dt.datetime.utcnow().timestamp():
+        if send_time < time.time():
             return
 
-        settings = self.guild_map[payload.guild_id]
-        reaction_role = await self.get_finalcall_taskrole(payload.guild_id, embed)
-        member = self.bot.get_guild(payload.guild_id).get_member(payload.user_id)
+        # The embed may be shared with reminder_embed_cache and the cached message, the final call edits a copy.
+        reaction_role = await self.get_finalcall_taskrole(payload.guild_id, embed.copy())
+        if reaction_role is None:
+            return
         self.logger.info(
             f'{member} reacted for {reaction_role} which will be sent at {datetime.fromtimestamp(send_time)}')
-        await member.add_roles(reaction_role)
-        member_dm = await member.create_dm()
-        self._serialize_guild_map()
-        try:
-            await member_dm.send(f"Final Call Alarm Set. You are alloted `{reaction_role.name}` which will be pinged"
-                                 f" {settings.finalcall_before} mins before the contest")
-        except:
-            await self.victim_card(member)
+        self.guild_map_dirty = True
+        await asyncio.gather(
+            member.add_roles(reaction_role),
+            self.send_dm(member, f"Final Call Alarm Set. You are alloted `{reaction_role.name}` which will be pinged"
+                                 f" {settings.finalcall_before} mins before the contest"))
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
-        response = await self.do_validation_check(payload)
+        # The remove path needs the live reaction count, so it always reads the message.
+        response = await self.do_validation_check(payload, count_reactions=True)
         if response is None:
             return
 
-        reaction_count, embed = response
-        reaction_role = await self.get_finalcall_taskrole(payload.guild_id, embed, True)
+        reaction_count, embed, member = response
+        reaction_role = await self.get_finalcall_taskrole(payload.guild_id, embed.copy(), True)
 
         link, _ = self.get_values_from_embed(embed)
         if reaction_role is None:
-            assert link not in self.finalcall_map[payload.guild_id]
+            assert link not in self.finalcall_map.get(payload.guild_id, {})
             return
 
-        member = self.bot.get_guild(payload.guild_id).get_member(payload.user_id)
         self.logger.info(f'{member} unreacted for {reaction_role.name}')
-        await member.remove_roles(reaction_role)
-        member_dm = await member.create_dm()
-        try:
-            await member_dm.send(f"Final Call Alarm Cleared for '{reaction_role.name}'")
-        except:
-            await self.victim_card(member)
+        await asyncio.gather(member.remove_roles(reaction_role),
+                             self.send_dm(member, f"Final Call Alarm Cleared for '{reaction_role.name}'"))
 
         if reaction_count == 1:
-            if link in self.finalcall_map[payload.guild_id]:
+            if link in self.finalcall_map.get(payload.guild_id, {}):
                 self.finaltasks[payload.guild_id][link].cancel()
                 del self.finalcall_map[payload.guild_id][link]
                 del self.finaltasks[payload.guild_id][link]
             await reaction_role.delete()
-        self._serialize_guild_map()
+        self.guild_map_dirty = True
 
     #  Nope React Command Group
     @commands.group(brief="Manage reactions in case of no reacts", invoke_without_command=True)
@@ -655,12 +948,14 @@ class Reminders(commands.Cog):
     @commands.has_role('Prabh')
     async def enable_lastreact(self, ctx):
         self.guild_map[ctx.guild.id].auto_nope_react = True
+        self.guild_map_dirty = True
         await ctx.send(embed=discord_common.embed_success('Enabled auto nope react'))
 
     @lastreact.command(name='disable', brief='Disable auto nope react')
     @commands.has_role('Prabh')
     async def disable_lastreact(self, ctx):
         self.guild_map[ctx.guild.id].auto_nope_react = False
+        self.guild_map_dirty = True
         await ctx.send(embed=discord_common.embed_success('Disabled auto nope react'))
 
     #  Self First React Command Group
@@ -673,33 +968,40 @@ class Reminders(commands.Cog):
     @commands.has_any_role('Admin', constants.REMIND_MODERATOR_ROLE)
     async def enable_firstreact(self, ctx):
         self.guild_map[ctx.guild.id].add_first_reaction = True
+        self.guild_map_dirty = True
         await ctx.send(embed=discord_common.embed_success('Enabled self first react'))
 
     @firstreact.command(name='disable', brief='Disable self first react')
     @commands.has_any_role('Admin', constants.REMIND_MODERATOR_ROLE)
     async def disable_firstreact(self, ctx):
         self.guild_map[ctx.guild.id].add_first_reaction = False
+        self.guild_map_dirty = True
         await ctx.send(embed=discord_common.embed_success('Disabled self first react'))
 
     @commands.Cog.listener()
     async def on_message(self, message):
-        if message.guild is None:
+        if message.guild is None or not message.embeds:
             return
-        settings = self.guild_map[message.guild.id]
-        if message.channel.id != settings.remind_channel_id or not message.embeds:
+        settings = self.guild_map.get(message.guild.id)
+        if settings is None or message.channel.id != settings.remind_channel_id:
             return
 
-        remind_role = self.bot.get_guild(message.guild.id).get_role(settings.remind_role_id)
-        if settings.add_first_reaction and remind_role in message.role_mentions:
+        if settings.add_first_reaction and settings.remind_role_id in message.raw_role_mentions:
             await message.add_reaction(self.reaction_emoji)
 
-        if settings.auto_nope_react:
+        # A resumed gateway session can replay the same message, only schedule one nope per reminder.
+        if settings.auto_nope_react and message.id not in self.nope_tasks:
             _, start_time = self.get_values_from_embed(message.embeds[0])
-            delay = start_time - dt.datetime.utcnow().timestamp() + 300
-            await asyncio.sleep(delay)
-            message = await self.bot.get_channel(message.channel.id).fetch_message(message.id)
-            if not message.reactions:
-                await message.add_reaction(self.bot.get_emoji(self.nope_emoji))
+            delay = start_time - time.time() + 300
+            task = asyncio.create_task(self._nope_react_after(message.channel.id, message.id, delay))
+            self.nope_tasks[message.id] = task
+            task.add_done_callback(lambda _, message_id=message.id: self.nope_tasks.pop(message_id, None))
+
+    async def _nope_react_after(self, channel_id, message_id, delay):
+        await asyncio.sleep(delay)
+        message = await self._get_message(channel_id, message_id)
+        if not message.reactions:
+            await message.add_reaction(self.bot.get_emoji(self.nope_emoji))
 
     @commands.group(brief="Manage Final Call Reminder", invoke_without_command=True)
     async def final(self, ctx):
@@ -711,33 +1013,28 @@ class Reminders(commands.Cog):
         if not before or before < 0:
             raise RemindersCogError('Please provide valid `before` values')
 
-        self.guild_map[ctx.guild.id].finalcall_before = before
-        self.guild_map[ctx.guild.id].finalcall_channel_id = ctx.channel.id
+        settings = self.guild_map[ctx.guild.id]
+        settings.finalcall_before = before
+        settings.finalcall_channel_id = ctx.channel.id
+        self.guild_map_dirty = True
 
-        finalcall_channel = ctx.guild.get_channel(self.guild_map[ctx.guild.id].finalcall_channel_id)
+        finalcall_channel = ctx.guild.get_channel(settings.finalcall_channel_id)
 
         embed = discord_common.embed_success('Final Call Settings Saved Successfully')
         embed.add_field(name='Final Call channel', value=finalcall_channel.mention)
         embed.add_field(name='Final Call Before',
-                        value=f"{self.guild_map[ctx.guild.id].finalcall_before} mins before contest")
+                        value=f"{settings.finalcall_before} mins before contest")
 
         await ctx.send(embed=embed)
 
     @commands.command(brief='Get Info about guild', invoke_without_command=True)
     async def settings(self, ctx):
         """Shows the current settings for the guild"""
-        settings = self.guild_map[ctx.guild.id]
+        settings = self.guild_map.get(ctx.guild.id) or get_default_guild_settings()
 
-        remind_channel = ctx.guild.get_channel(settings.remind_channel_id)
-        remind_role = ctx.guild.get_role(settings.remind_role_id)
-
-        finalcall_channel = ctx.guild.get_channel(settings.finalcall_channel_id)
-
-        subscribed_websites = []
-        for website, data in settings.website_patterns.items():
-            if data.allowed_patterns:
-                subscribed_websites.append(website)
-        subscribed_websites_str = ", ".join(subscribed_websites)
+        guild = ctx.guild
+        subscribed_websites_str = ", ".join(website for website, data in settings.website_patterns.items()
+                                            if data.allowed_patterns)
 
         remind_before_str = "Not Set"
         final_before_str = "Not Set"
@@ -746,31 +1043,19 @@ class Reminders(commands.Cog):
                                 f" mins before contest"
         if settings.finalcall_before is not None:
             final_before_str = f"At {settings.finalcall_before} mins before contest"
-        embed = discord_common.embed_success(f'Current settings')
-
-        if remind_channel is not None:
-            embed.add_field(name='Remind Channel', value=remind_channel.mention)
-        else:
-            embed.add_field(name='Remind Channel', value="Not Set")
 
-        if remind_role is not None:
-            embed.add_field(name='Remind Role', value=remind_role.mention)
-        else:
-            embed.add_field(name='Remind Role', value="Not Set")
-
-        embed.add_field(name='Remind Before', value=remind_before_str)
-
-        if finalcall_channel is not None:
-            embed.add_field(name='Final Call Channel', value=finalcall_channel.mention)
-        else:
-            embed.add_field(name='Final Call Channel', value="Not Set")
-
-        embed.add_field(name='Final Call Before', value=final_before_str)
-        embed.add_field(name="\u200b", value="\u200b")
-
-        embed.add_field(name='Subscribed websites', value=f'{subscribed_websites_str}', inline=False)
+        fields = [('Remind Channel', _mention_or_not_set(guild.get_channel(settings.remind_channel_id))),
+                  ('Remind Role', _mention_or_not_set(guild.get_role(settings.remind_role_id))),
+                  ('Remind Before', remind_before_str),
+                  ('Final Call Channel', _mention_or_not_set(guild.get_channel(settings.finalcall_channel_id))),
+                  ('Final Call Before', final_before_str),
+                  ("\u200b", "\u200b")]
+        embed = discord_common.embed_success(f'Current settings')
+        for name, value in fields:
+            embed.add_field(name=name, value=value)
+        embed.add_field(name='Subscribed websites', value=subscribed_websites_str, inline=False)
 
-        embed.set_footer(text=ctx.guild.name, icon_url=ctx.guild.icon)
+        embed.set_footer(text=guild.name, icon_url=guild.icon)
         await ctx.send(embed=embed)
 
     @discord_common.send_error_if(RemindersCogError)
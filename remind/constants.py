@@ -4,7 +4,8 @@ DATA_DIR = 'data'
 LOGS_DIR = 'logs'
 CONTESTS_DB_FILE_PATH = os.path.join(DATA_DIR, 'contests.json')
 LOG_FILE_PATH = os.path.join(LOGS_DIR, 'remind.log')
-GUILD_SETTINGS_MAP_PATH = os.path.join(DATA_DIR, 'guild_settings_map')
+GUILD_SETTINGS_MAP_PATH = os.path.join(DATA_DIR, 'guild_settings_map.json')
+LEGACY_GUILD_SETTINGS_MAP_PATH = os.path.join(DATA_DIR, 'guild_settings_map')
 ALL_DIRS = (attrib_value for attrib_name, attrib_value in list(globals().items()) if attrib_name.endswith('DIR'))
 SUPER_USERS = []
 REMIND_MODERATOR_ROLE = "RemindMod"
@@ -1,8 +1,9 @@
 import logging
 import os
+import threading
 import datetime as dt
 import requests
-import json
+import orjson
 
 from remind import constants
 from discord.ext import commands
@@ -12,6 +13,13 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 URL_BASE = 'https://clist.by/api/v2/contest'
 _CLIST_API_TIME_DIFFERENCE = 30 * 60  # seconds
+# Reused across queries so the connection to clist.by is kept alive between refreshes.
+_session = requests.Session()
+# Time of the last query made by this process. The db file is only rewritten when the contests change,
+# so its querytime can lag behind this.
+_last_query_time = 0
+# cache() runs on executor threads, both for the periodic refresh and forced resets.
+_cache_lock = threading.Lock()
 
 
 class ClistApiError(commands.CommandError):
@@ -43,7 +51,7 @@ def _query_api():
     }
 
     try:
-        resp = requests.get(URL_BASE, params=param)
+        resp = _session.get(URL_BASE, params=param)
         if resp.status_code != 200:
             raise ClistApiError
         return resp.json()['objects']
@@ -53,19 +61,28 @@ def _query_api():
 
 
 def cache(forced=False):
+    with _cache_lock:
+        _cache(forced)
+
+
+def _cache(forced):
+    global _last_query_time
     current_time_stamp = dt.datetime.utcnow().timestamp()
+    if not forced and current_time_stamp - _last_query_time < _CLIST_API_TIME_DIFFERENCE:
+        return
+
     db_file = Path(constants.CONTESTS_DB_FILE_PATH)
 
     db = None
     try:
-        with db_file.open() as f:
-            db = json.load(f)
+        db = orjson.loads(db_file.read_bytes())
     except BaseException:
         pass
 
     last_time_stamp = db['querytime'] if db and db['querytime'] else 0
 
     if not forced and current_time_stamp - last_time_stamp < _CLIST_API_TIME_DIFFERENCE:
+        _last_query_time = last_time_stamp
         return
 
     try:
@@ -73,6 +90,12 @@ def cache(forced=False):
     except:
         return
 
+    _last_query_time = current_time_stamp
+    if db and db['objects'] == contests:
+        # Leave the file, and with it its mtime, alone so readers can tell nothing changed.
+        return
+
     db = {'querytime': current_time_stamp, 'objects': contests}
-    with open(db_file, 'w') as f:
-        json.dump(db, f)
+    tmp_file = db_file.with_name(db_file.name + '.tmp')
+    tmp_file.write_bytes(orjson.dumps(db))
+    os.replace(tmp_file, db_file)
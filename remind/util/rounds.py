@@ -1,15 +1,34 @@
 import datetime as dt
+import functools
+import re
 from remind.util import website_schema
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_matcher(allowed_patterns, disallowed_patterns):
+    # Matches names containing an allowed pattern but none of the disallowed ones, in a single regex match.
+    if not allowed_patterns:
+        return None
+    regex = '.*(?:' + '|'.join(map(re.escape, allowed_patterns)) + ')'
+    if disallowed_patterns:
+        regex = '(?!.*(?:' + '|'.join(map(re.escape, disallowed_patterns)) + '))' + regex
+    return re.compile(regex, re.DOTALL)
+
+
 class Round:
+    __slots__ = ('id', 'start_time', 'start_timestamp', 'duration', 'end_time', 'url', 'website', 'name',
+                 '_name_lower')
+
     def __init__(self, contest):
         self.id = contest['id']
-        self.start_time = dt.datetime.strptime(contest['start'], '%Y-%m-%dT%H:%M:%S')
+        self.start_time = dt.datetime.fromisoformat(contest['start'])
+        self.start_timestamp = self.start_time.replace(tzinfo=dt.timezone.utc).timestamp()
         self.duration = dt.timedelta(seconds=contest['duration'])
+        self.end_time = self.start_time + self.duration
         self.url = contest['href']
         self.website = contest['resource']
-        self.name = website_schema.schema[self.website].normalize(contest['event'])
+        self.name = website_schema.get_schema(self.website).normalize(contest['event'])
+        self._name_lower = self.name.lower()
 
     def __str__(self):
         st = "ID = " + str(self.id) + ", "
@@ -25,20 +44,14 @@ class Round:
         return site == self.website
 
     def is_rare(self):
-        schema = website_schema.schema[self.website]
-        return schema.rare
+        return website_schema.get_schema(self.website).rare
 
     def is_desired(self, websites):
-
-        for disallowed_pattern in websites[self.website].disallowed_patterns:
-            if disallowed_pattern in self.name.lower():
-                return False
-
-        for allowed_pattern in websites[self.website].allowed_patterns:
-            if allowed_pattern in self.name.lower():
-                return True
-
-        return False
+        patterns = websites.get(self.website)
+        if patterns is None:
+            return False
+        matcher = _compile_matcher(tuple(patterns.allowed_patterns), tuple(patterns.disallowed_patterns))
+        return matcher is not None and matcher.match(self._name_lower) is not None
 
     def __repr__(self):
         return "Round - " + self.name
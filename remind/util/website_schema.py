@@ -1,4 +1,3 @@
-from collections import defaultdict
 import re
 
 
@@ -16,18 +15,32 @@ class WebsitePatterns:
         self.shorthands = _shorthands or []
         self.prefix = _prefix
         self._normalize_regex = _normalize_regex
+        self._normalize_re = re.compile(_normalize_regex)
         self.rare = _rare
 
+    def copy(self):
+        return WebsitePatterns(_allowed_patterns=self.allowed_patterns[:],
+                               _disallowed_patterns=self.disallowed_patterns[:],
+                               _shorthands=self.shorthands[:],
+                               _prefix=self.prefix,
+                               _normalize_regex=self._normalize_regex,
+                               _rare=self.rare)
+
     def normalize(self, name):
-        try:
-            name = re.compile(self._normalize_regex).search(name).group()
-        except AttributeError:
-            pass
-        return name
+        match = self._normalize_re.search(name)
+        return match.group() if match else name
+
+
+# Returned for websites missing from the schema, shared so lookups never insert into it.
+_DEFAULT_PATTERNS = WebsitePatterns()
+
+
+def get_schema(website):
+    return schema.get(website, _DEFAULT_PATTERNS)
 
 
 # Todo : Move this to external db
-schema = defaultdict(WebsitePatterns)
+schema = dict()
 
 schema['codeforces.com'] = WebsitePatterns(
     _allowed_patterns=[''],